@@ -13,12 +13,15 @@ from europa_1400_tools.extractor.commands import app as extract_app
 from europa_1400_tools.helpers import ask_for_game_path
 from europa_1400_tools.mapper.commands import app as map_app
 from europa_1400_tools.models import CommonOptions
+from europa_1400_tools.server.commands import client_app, serve_app
 
 app = typer.Typer()
 app.add_typer(extract_app, name="extract")
 app.add_typer(decode_app, name="decode")
 app.add_typer(convert_app, name="convert")
 app.add_typer(map_app, name="map")
+app.add_typer(serve_app, name="serve")
+app.add_typer(client_app, name="client")
 
 
 @app.callback()
@@ -31,7 +34,19 @@ def main(
         DEFAULT_OUTPUT_PATH, "--output-path", "-o", help="Path to the output directory."
     ),
     use_cache: bool = typer.Option(True, "--use-cache", "-c", help="Use cached files."),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Ignore the conversion cache and convert unchanged files again.",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output."),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of parallel jobs, defaults to the number of CPU cores.",
+    ),
 ) -> None:
     """Main entry point."""
 
@@ -48,4 +63,6 @@ def main(
         output_path=output_path,
         use_cache=use_cache,
         verbose=verbose,
+        use_conversion_cache=not force,
+        jobs=jobs,
     )
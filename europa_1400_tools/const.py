@@ -1,6 +1,7 @@
 """Constants for the europa_1400_tools package."""
 
 from enum import Enum, IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -75,7 +76,7 @@ BIN_FILES = [
     TEXTURES_BIN,
 ]
 
-CONVERTIBLE_PATHS = [
+CONVERTIBLE_PATHS = (
     AOBJ_PATH,
     AGEB_PATH,
     GILDE_ADD_ON_GERMAN_GFX_PATH,
@@ -83,7 +84,7 @@ CONVERTIBLE_PATHS = [
     OBJECTS_PATH,
     SCENES_PATH,
     SFX_PATH,
-]
+)
 
 # Output Directories and Files
 
@@ -101,6 +102,13 @@ OUTPUT_OBJECTS_DIR = "objects"
 OUTPUT_TEXTURES_DIR = "textures"
 MAPPED_ANIMATONS_PICKLE = "mapped_animations.pickle"
 MISSING_PATHS_TXT = "missing_paths.txt"
+CONVERSION_CACHE_DIR = ".cache"
+SERVER_SOCKET = "server.sock"
+
+# Server
+
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 14000
 
 # File Extensions
 
@@ -127,11 +135,13 @@ DAT_EXTENSION = ".dat"
 BIN_EXTENSION = ".bin"
 TXT_EXTENSION = ".txt"
 
-IGNORED_EXTENSIONS = [
-    LFS_EXTENSION,
-    TXS_EXTENSION,
-    TXT_EXTENSION,
-]
+IGNORED_EXTENSIONS = frozenset(
+    [
+        LFS_EXTENSION,
+        TXS_EXTENSION,
+        TXT_EXTENSION,
+    ]
+)
 
 # Construct
 
@@ -194,6 +204,7 @@ class TargetFormat(Format):
         return Enum("TyperTargetFormat", enum_dict)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def from_typer(typer_target_format: str) -> Optional["TargetFormat"]:
         """Return the target format for the given typer target format."""
         for target_format in TargetFormat:
@@ -296,19 +307,53 @@ class SourceFormat(Format):
     def from_path(path: Path) -> Optional["SourceFormat"]:
         """Return the source format for the given extension."""
 
+        source_format = classify(path.name)
+        if source_format is not None:
+            return source_format
+
+        # formats sharing their extension are told apart by their path
+        path_string = str(path)
         for source_format in SourceFormat:
-            if source_format.source_path is not None and str(path).endswith(
+            if source_format.source_path is not None and path_string.endswith(
                 str(source_format.source_path)
             ):
                 return source_format
 
+        suffix = path.suffix.lower()
         for source_format in SourceFormat:
-            if source_format.value[1].lower() == path.suffix.lower():
+            if source_format.extension.lower() == suffix:
                 return source_format
 
         return None
 
 
+# source formats that are identified by their file extension alone
+_SOURCE_FORMAT_BY_EXTENSION: dict[str, SourceFormat] = {
+    source_format.extension.lower(): source_format
+    for source_format in SourceFormat
+    if [format.extension.lower() for format in SourceFormat].count(
+        source_format.extension.lower()
+    )
+    == 1
+}
+
+
+def classify(file_name: str) -> SourceFormat | None:
+    """Return the source format identified by the extension of the file name.
+
+    Formats sharing their extension with other formats are not identified,
+    SourceFormat.from_path tells them apart by their path.
+    """
+
+    stem, _, extension = file_name.rpartition(".")
+
+    # names without a stem, like ".bgf", have no extension
+    if not stem:
+        return None
+
+    return _SOURCE_FORMAT_BY_EXTENSION.get(f".{extension.lower()}")
+
+
 class OgrElementType(Enum):
     """Ogr element types."""
 
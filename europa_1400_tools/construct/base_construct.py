@@ -1,3 +1,4 @@
+import io
 import json
 from abc import ABC
 from dataclasses import dataclass
@@ -28,6 +29,18 @@ class BaseConstruct(ABC, DataclassMixin):
 
         return obj
 
+    @classmethod
+    def from_bytes(cls: Type[T], data: bytes, file_path: Path) -> T:
+        """Parse the content of the file and return the construct."""
+
+        # the path of the construct is taken from the name of the stream
+        stream = io.BytesIO(data)
+        stream.name = str(file_path)
+
+        obj: T = DataclassStruct(cls).parse_stream(stream)
+
+        return obj
+
     def to_dict(self) -> dict:
         """Return the dict representation of the construct."""
 
@@ -44,9 +57,7 @@ class BaseConstruct(ABC, DataclassMixin):
         return obj_json
 
     @staticmethod
-    def encode_construct(value: Any):
-        try:
-            json.dumps(value)
-            return value
-        except TypeError:
-            return None
+    def encode_construct(_value: Any):
+        """Encode values the json encoder cannot serialize, which are unsupported."""
+
+        return None
@@ -1,11 +1,36 @@
 from dataclasses import dataclass
 
 import construct as cs
+import numpy as np
 from construct_typed import DataclassMixin, DataclassStruct, csfield
 
 from europa_1400_tools.const import OBJECTS_STRING_ENCODING, SourceFormat
 from europa_1400_tools.construct.baf import Vector3
 from europa_1400_tools.construct.base_construct import BaseConstruct
+from europa_1400_tools.construct.common import ignoredcsfield
+
+VECTOR3_DTYPE = np.dtype([("x", "<f4"), ("y", "<f4"), ("z", "<f4")])
+FACE_DTYPE = np.dtype([("a", "<u4"), ("b", "<u4"), ("c", "<u4")])
+TEXTURE_MAPPING_DTYPE = np.dtype(
+    [
+        ("vertex_u", VECTOR3_DTYPE),
+        ("vertex_v", VECTOR3_DTYPE),
+        ("vertex_w", VECTOR3_DTYPE),
+    ]
+)
+VERTEX_MAPPING_DTYPE = np.dtype(
+    [
+        ("vertex1", VECTOR3_DTYPE),
+        ("vertex2", VECTOR3_DTYPE),
+    ]
+)
+POLYGON_MAPPING_DTYPE = np.dtype(
+    [
+        ("face", FACE_DTYPE),
+        ("texture_mapping", TEXTURE_MAPPING_DTYPE),
+        ("texture_index", "u1"),
+    ]
+)
 
 
 def skip_until(obj, ctx):
@@ -204,6 +229,13 @@ class BgfMappingObject(DataclassMixin):
     texture_count: int = csfield(cs.Int32ul)
     vertex_mapping_count: int = csfield(cs.Int32ul)
     polygon_mapping_count: int = csfield(cs.Int32ul)
+    vertex_mappings_bytes: bytes = ignoredcsfield(
+        cs.Peek(
+            cs.Bytes(
+                lambda ctx: ctx.vertex_mapping_count * VERTEX_MAPPING_DTYPE.itemsize
+            )
+        )
+    )
     vertex_mappings: list[VertexMapping] = csfield(
         cs.Array(lambda ctx: ctx.vertex_mapping_count, DataclassStruct(VertexMapping))
     )
@@ -211,10 +243,29 @@ class BgfMappingObject(DataclassMixin):
         cs.Array(8, DataclassStruct(VertexMapping))
     )
     some_float: float = csfield(cs.Float32l)
+    polygons_bytes: bytes = ignoredcsfield(
+        cs.Peek(
+            cs.Bytes(
+                lambda ctx: ctx.polygon_mapping_count * POLYGON_MAPPING_DTYPE.itemsize
+            )
+        )
+    )
     polygons: list[PolygonMapping] = csfield(
         cs.Array(lambda ctx: ctx.polygon_mapping_count, DataclassStruct(PolygonMapping))
     )
 
+    @property
+    def vertex_mappings_array(self) -> np.ndarray:
+        """Return the vertex mappings as a structured array."""
+
+        return np.frombuffer(self.vertex_mappings_bytes, dtype=VERTEX_MAPPING_DTYPE)
+
+    @property
+    def polygons_array(self) -> np.ndarray:
+        """Return the polygon mappings as a structured array."""
+
+        return np.frombuffer(self.polygons_bytes, dtype=POLYGON_MAPPING_DTYPE)
+
 
 @dataclass
 class BgfTexture(DataclassMixin):
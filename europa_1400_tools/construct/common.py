@@ -85,8 +85,13 @@ def asdict(obj, *, dict_factory=dict):
     return _asdict_inner(obj, dict_factory)
 
 
+_ATOMIC_TYPES = (type(None), bool, int, float, str, bytes)
+
+
 def _asdict_inner(obj, dict_factory):
-    if _is_dataclass_instance(obj):
+    if isinstance(obj, _ATOMIC_TYPES):
+        return obj
+    elif _is_dataclass_instance(obj):
         result = []
         for f in fields(obj):
             if f.metadata.get("ignored", False) is True:
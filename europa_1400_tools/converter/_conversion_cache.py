@@ -0,0 +1,81 @@
+"""Cache of conversions, skipping files that were converted unchanged before."""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Callable, Iterable
+
+
+def file_digest(file_path: Path) -> str:
+    """Return the hex digest of the content of the file."""
+
+    with open(file_path, "rb") as input_file:
+        return hashlib.file_digest(
+            input_file, lambda: hashlib.sha1(usedforsecurity=False)
+        ).hexdigest()
+
+
+def paths_digest(file_paths: Iterable[Path]) -> str:
+    """Return the hex digest of the paths, sizes and modification times.
+
+    This identifies the state of many input files without reading them.
+    """
+
+    digest = hashlib.sha1(usedforsecurity=False)
+
+    for file_path in sorted(file_paths):
+        try:
+            stat = file_path.stat()
+            digest.update(f"{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        except OSError:
+            digest.update(f"{file_path}\0missing\n".encode())
+
+    return digest.hexdigest()
+
+
+def cached_convert(
+    cache_path: Path,
+    file_path: Path,
+    key: str,
+    convert: Callable[[], list[Path]],
+) -> list[Path]:
+    """Convert the file unless it was converted with the same key before.
+
+    The previous output paths are returned, if the content of the file is
+    unchanged and all of them still exist. Each conversion has its own cache
+    entry, so parallel workers never write to the same file.
+    """
+
+    entry_key = f"{file_path.resolve()}\n{key}".encode("utf-8")
+    entry_name = hashlib.sha1(entry_key, usedforsecurity=False).hexdigest()
+    entry_path = cache_path / f"{entry_name}.json"
+
+    digest = file_digest(file_path)
+
+    try:
+        entry = json.loads(entry_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        entry = None
+
+    if entry is not None and entry.get("digest") == digest:
+        output_paths = [Path(output_path) for output_path in entry["output_paths"]]
+
+        if all(output_path.exists() for output_path in output_paths):
+            logging.debug(f"Skipping unchanged {file_path}")
+            return output_paths
+
+    output_paths = convert()
+
+    cache_path.mkdir(parents=True, exist_ok=True)
+    entry_path.write_text(
+        json.dumps(
+            {
+                "digest": digest,
+                "output_paths": [str(output_path) for output_path in output_paths],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    return output_paths
@@ -0,0 +1,124 @@
+"""Helpers for running conversions in parallel."""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterable, Iterator, Literal, Sized, TypeVar
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+ParallelMode = Literal["thread", "process"]
+
+# executors kept alive between calls of run_parallel, see persistent_executors
+_persistent_executors: dict[tuple[Hashable, ParallelMode, int], Executor] | None = None
+
+
+def default_workers(mode: ParallelMode) -> int:
+    """Return the default number of workers for the parallel mode."""
+
+    cpu_count = os.cpu_count() or 1
+
+    # threads mostly wait for file io, so more of them than cores pay off
+    if mode == "thread":
+        return min(32, cpu_count * 4)
+
+    return cpu_count
+
+
+@contextmanager
+def persistent_executors() -> Iterator[None]:
+    """Keep the executors of run_parallel alive until the context exits.
+
+    Calls of run_parallel passing the same key reuse the warm workers of the
+    first call instead of starting new ones.
+    """
+
+    global _persistent_executors
+    _persistent_executors = {}
+
+    try:
+        yield
+    finally:
+        executors = _persistent_executors
+        _persistent_executors = None
+
+        for executor in executors.values():
+            executor.shutdown()
+
+
+def discard_executors(key: Hashable) -> None:
+    """Shut down the executors kept alive for the key, if any."""
+
+    if _persistent_executors is None:
+        return
+
+    for executor_key in list(_persistent_executors):
+        if executor_key[0] == key:
+            _persistent_executors.pop(executor_key).shutdown()
+
+
+def _create_executor(
+    mode: ParallelMode,
+    workers: int,
+    initializer: Callable[..., None] | None,
+    initargs: tuple[Any, ...],
+) -> Executor:
+    """Create a thread or process pool."""
+
+    if mode == "process":
+        return ProcessPoolExecutor(
+            max_workers=workers, initializer=initializer, initargs=initargs
+        )
+
+    return ThreadPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    )
+
+
+def run_parallel(
+    func: Callable[[ItemType], ResultType],
+    items: Iterable[ItemType],
+    mode: ParallelMode = "thread",
+    workers: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+    chunksize: int | None = None,
+    key: Hashable | None = None,
+) -> list[ResultType]:
+    """Apply func to all items in a thread or process pool.
+
+    The results are returned in the order of the items. In process mode, func
+    has to be picklable, e.g. a module level function. Inside of
+    persistent_executors, the pool is kept alive and reused for the same key,
+    so the initializer should only depend on the key.
+    """
+
+    if workers is None:
+        workers = default_workers(mode)
+
+    if mode == "process":
+        # hand out small batches, while keeping every worker busy
+        if chunksize is None:
+            chunksize = (
+                max(1, min(8, len(items) // (workers * 4)))
+                if isinstance(items, Sized)
+                else 1
+            )
+    else:
+        # chunks only save inter-process communication
+        chunksize = 1
+
+    if _persistent_executors is not None and key is not None:
+        executor_key = (key, mode, workers)
+
+        executor = _persistent_executors.get(executor_key)
+        if executor is None:
+            executor = _persistent_executors[executor_key] = _create_executor(
+                mode, workers, initializer, initargs
+            )
+
+        return list(executor.map(func, items, chunksize=chunksize))
+
+    with _create_executor(mode, workers, initializer, initargs) as executor:
+        return list(executor.map(func, items, chunksize=chunksize))
@@ -8,6 +8,9 @@ from europa_1400_tools.converter.base_converter import BaseConverter
 class AGebConverter(BaseConverter):
     """Convert AGeb files."""
 
+    # the conversion is dominated by file io
+    parallel_mode = "thread"
+
     def convert_file(
         self,
         file_path: Path,
@@ -22,7 +25,7 @@ class AGebConverter(BaseConverter):
         ageb_json = ageb.to_json()
 
         output_path = output_path / Path("building_data.json")
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.make_directory(output_path.parent)
         output_path.write_text(ageb_json, encoding="utf-8")
 
         return [output_path]
@@ -8,6 +8,9 @@ from europa_1400_tools.converter.base_converter import BaseConverter
 class AObjConverter(BaseConverter):
     """Convert AObj files."""
 
+    # the conversion is dominated by file io
+    parallel_mode = "thread"
+
     def convert_file(
         self,
         file_path: Path,
@@ -22,7 +25,7 @@ class AObjConverter(BaseConverter):
         aobj_json = aobj.to_json()
 
         output_path = output_path / Path("object_data.json")
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.make_directory(output_path.parent)
         output_path.write_text(aobj_json, encoding="utf-8")
 
         return [output_path]
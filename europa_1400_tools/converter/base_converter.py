@@ -2,26 +2,88 @@
 
 import logging
 from abc import ABC, abstractmethod
+from itertools import islice
 from pathlib import Path
-from typing import TypeVar, final
+from typing import Iterable, Iterator, Sized, TypeVar, final
 
 from europa_1400_tools.const import SourceFormat, TargetFormat
+from europa_1400_tools.converter._conversion_cache import cached_convert
+from europa_1400_tools.converter._parallel import ParallelMode, run_parallel
+from europa_1400_tools.helpers import bulk_read, prefetch_files
 from europa_1400_tools.models import CommonOptions
 
 InputType = TypeVar("InputType")
 OutputType = TypeVar("OutputType")
 ConverterType = TypeVar("ConverterType", bound="BaseConverter")
 
+# converter of the current worker process
+_worker_converter: "BaseConverter | None" = None
+
+# output directories created during the current conversion of this process,
+# conversions are numbered so worker processes notice when a new one starts
+_created_directories: set[Path] = set()
+_conversion_id = 0
+
+
+def _init_worker(converter: "BaseConverter") -> None:
+    """Store the converter in the worker process."""
+
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _start_conversion(conversion_id: int) -> None:
+    """Forget the directories created during the previous conversion."""
+
+    global _conversion_id
+    _conversion_id = conversion_id
+    _created_directories.clear()
+
+
+def _convert_file_worker(
+    args: tuple[int, tuple[Path, Path, Path, TargetFormat, bool]]
+) -> list[Path]:
+    """Convert file with the converter of the worker process."""
+
+    assert _worker_converter is not None
+
+    # persistent worker processes outlive conversions
+    conversion_id, file_args = args
+    if conversion_id != _conversion_id:
+        _start_conversion(conversion_id)
+
+    return _worker_converter._convert_file_args(file_args)
+
 
 class BaseConverter(ABC):
     """Base class for converters."""
 
     common_options: CommonOptions
 
+    # how files are converted in parallel, if at all
+    parallel_mode: ParallelMode | None = None
+
+    # whether the files are large enough to be worth reading ahead
+    prefetch: bool = False
+
+    # state of the inputs when the converter was set up, see input_state
+    cache_inputs: str | None = None
+
+    # version of the output, increase it to redo cached conversions
+    version: int = 1
+
+    # whether files are small enough to be read in batches ahead of converting,
+    # which only happens when they are converted one after another
+    read_in_batches: bool = False
+
+    # contents of the files read ahead, see read_file
+    _file_contents: dict[Path, bytes]
+
     def __init__(self, common_options: CommonOptions):
         """Initialize the converter."""
 
         self.common_options = common_options
+        self._file_contents = {}
 
     @abstractmethod
     def convert_file(
@@ -37,7 +99,7 @@ class BaseConverter(ABC):
     @final
     def convert(
         self,
-        file_paths: list[Path],
+        file_paths: Iterable[Path],
         output_path: Path,
         base_path: Path,
         source_format: SourceFormat,
@@ -48,12 +110,78 @@ class BaseConverter(ABC):
 
         output_paths: list[Path] = []
 
+        # the state of the inputs is taken once, before the workers receive
+        # their copies of the converter
+        if self.common_options.use_conversion_cache and self.cache_inputs is None:
+            self.cache_inputs = self.input_state()
+
+        # output directories may have been removed since the last conversion
+        conversion_id = _conversion_id + 1
+        _start_conversion(conversion_id)
+
+        # a single file is not worth starting workers for
+        single_file = isinstance(file_paths, Sized) and len(file_paths) <= 1
+
+        parallel = (
+            self.parallel_mode is not None
+            and self.common_options.jobs != 1
+            and not single_file
+        )
+
+        if parallel:
+            # the executor submits all files up front anyway, and knowing their
+            # count lets run_parallel hand them to worker processes in batches
+            args = [
+                (
+                    file_path,
+                    output_path,
+                    base_path,
+                    target_format,
+                    create_subdirectories,
+                )
+                for file_path in file_paths
+            ]
+
+            if self.parallel_mode == "process":
+                # each worker process receives its own copy of the converter once
+                results = run_parallel(
+                    _convert_file_worker,
+                    [(conversion_id, file_args) for file_args in args],
+                    mode="process",
+                    workers=self.common_options.jobs,
+                    initializer=_init_worker,
+                    initargs=(self,),
+                    key=self,
+                )
+            else:
+                results = run_parallel(
+                    self._convert_file_args,
+                    args,
+                    mode="thread",
+                    workers=self.common_options.jobs,
+                    key=self,
+                )
+
+            for converted_file_paths in results:
+                if converted_file_paths is not None:
+                    output_paths.extend(converted_file_paths)
+
+            return output_paths
+
+        # files are read ahead while earlier ones are converted, small ones in
+        # batches and large ones by the kernel, workers are handed all files at
+        # once, so reading ahead for them would queue reads of all the files
+        if self.read_in_batches:
+            file_paths = self._read_ahead(file_paths)
+        elif self.prefetch:
+            file_paths = prefetch_files(file_paths)
+
         for file_path in file_paths:
             logging.debug(
                 f"Converting {file_path} from {source_format} to {target_format}..."
             )
 
-            converted_file_paths = self.convert_file(
+            converted_file_paths = self._convert_file_cached(
                 file_path,
                 output_path,
                 base_path,
@@ -65,3 +193,107 @@ class BaseConverter(ABC):
                 output_paths.extend(converted_file_paths)
 
         return output_paths
+
+    @staticmethod
+    def make_directory(directory: Path) -> None:
+        """Create the directory, unless it was created during this conversion.
+
+        Most output files share their directory with others, so this saves a
+        mkdir call for all but the first of them.
+        """
+
+        if directory in _created_directories:
+            return
+
+        directory.mkdir(parents=True, exist_ok=True)
+        _created_directories.add(directory)
+
+    def _read_ahead(
+        self, file_paths: Iterable[Path], batch_size: int = 64
+    ) -> Iterator[Path]:
+        """Yield the files after reading each batch of them at once."""
+
+        file_paths_iterator = iter(file_paths)
+
+        while batch := list(islice(file_paths_iterator, batch_size)):
+            self._file_contents = dict(zip(batch, bulk_read(batch)))
+            yield from batch
+
+        self._file_contents = {}
+
+    def read_file(self, file_path: Path) -> bytes:
+        """Return the content of the file, which may have been read ahead."""
+
+        data = self._file_contents.pop(file_path, None)
+        if data is None:
+            data = file_path.read_bytes()
+
+        return data
+
+    def _convert_file_args(
+        self, args: tuple[Path, Path, Path, TargetFormat, bool]
+    ) -> list[Path]:
+        """Convert file with the arguments packed into a tuple."""
+
+        file_path, output_path, base_path, target_format, create_subdirectories = args
+        logging.debug(f"Converting {file_path} to {target_format}...")
+
+        return self._convert_file_cached(
+            file_path,
+            output_path,
+            base_path,
+            target_format,
+            create_subdirectories,
+        )
+
+    @property
+    def cache_name(self) -> str:
+        """Return the name identifying the conversions in the cache."""
+
+        return f"{type(self).__name__}@{self.version}"
+
+    def input_state(self) -> str:
+        """Return the state of the inputs besides the converted file.
+
+        Cached conversions are redone when the state changes, e.g. when
+        textures used by the converted files were modified.
+        """
+
+        return ""
+
+    def _convert_file_cached(
+        self,
+        file_path: Path,
+        output_path: Path,
+        base_path: Path,
+        target_format: TargetFormat,
+        create_subdirectories: bool = False,
+    ) -> list[Path]:
+        """Convert file, unless it was converted unchanged before."""
+
+        def convert() -> list[Path]:
+            return self.convert_file(
+                file_path,
+                output_path,
+                base_path,
+                target_format,
+                create_subdirectories,
+            )
+
+        if not self.common_options.use_conversion_cache:
+            return convert()
+
+        return cached_convert(
+            self.common_options.conversion_cache_path,
+            file_path,
+            "\n".join(
+                [
+                    self.cache_name,
+                    self.cache_inputs or "",
+                    str(target_format),
+                    str(output_path.resolve()),
+                    str(create_subdirectories),
+                ]
+            ),
+            convert,
+        )
@@ -1,16 +1,40 @@
+import functools
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 from europa_1400_tools.const import TargetFormat
+from europa_1400_tools.construct.bgf import Bgf
+from europa_1400_tools.converter._conversion_cache import paths_digest
 from europa_1400_tools.converter.base_converter import BaseConverter
 from europa_1400_tools.extractor.commands import extract_file
 from europa_1400_tools.helpers import rebase_path
 
 
+# converting a file to multiple target formats parses it back to back
+@functools.lru_cache(maxsize=2)
+def _parse_bgf(file_path: Path, _mtime_ns: int) -> Bgf:
+    """Parse the BGF file, the modification time only keys the cache."""
+
+    return Bgf.from_file(file_path)
+
+
+def parse_bgf(file_path: Path) -> Bgf:
+    """Parse the BGF file, reusing the result while the file is unchanged."""
+
+    return _parse_bgf(file_path, file_path.stat().st_mtime_ns)
+
+
 class BgfConverter(BaseConverter, ABC):
     """Converter for BGF files."""
 
     extracted_texture_paths: list[Path]
+    extracted_textures_by_name: dict[str, Path]
+
+    # objects are independent of each other and expensive to convert
+    parallel_mode = "process"
+
+    # objects are large compared to the files of the other formats
+    prefetch = True
 
     def __init__(
         self,
@@ -23,6 +47,23 @@ class BgfConverter(BaseConverter, ABC):
             self.common_options.extracted_textures_path,
         )
 
+        # index the extracted textures by their lowercase name,
+        # keeping the first path for duplicate names
+        self.extracted_textures_by_name = {}
+        for extracted_textures_path in self.extracted_textures_paths:
+            self.extracted_textures_by_name.setdefault(
+                extracted_textures_path.stem.lower(), extracted_textures_path
+            )
+
+    def input_state(self) -> str:
+        """Return the state of the textures archive.
+
+        The textures are extracted anew from the archive for every converter,
+        so the extracted files change whenever the archive does.
+        """
+
+        return paths_digest([self.common_options.game_textures_path])
+
     def convert_file(
         self,
         file_path: Path,
@@ -33,8 +74,8 @@ class BgfConverter(BaseConverter, ABC):
     ) -> list[Path]:
         output_sub_path: Path = rebase_path(file_path.parent, base_path, output_path)
 
-        if not output_sub_path.exists():
-            output_sub_path.mkdir(parents=True)
+        # other worker processes may create the directory concurrently
+        self.make_directory(output_sub_path)
 
         return self.convert_bgf_file(
             file_path,
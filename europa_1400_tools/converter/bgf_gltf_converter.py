@@ -1,25 +1,26 @@
+import functools
+import hashlib
 import pickle
+import struct
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 from pygltflib import (
-    ANIM_LINEAR,
     ARRAY_BUFFER,
+    BYTE,
     ELEMENT_ARRAY_BUFFER,
     FLOAT,
     GLTF2,
     MASK,
     SCALAR,
     UNSIGNED_INT,
+    UNSIGNED_SHORT,
     VEC2,
     VEC3,
-    WEIGHTS,
     Accessor,
-    Animation,
-    AnimationChannel,
-    AnimationChannelTarget,
-    AnimationSampler,
     Attributes,
     Buffer,
     BufferView,
@@ -37,12 +38,16 @@ from pygltflib import (
 from europa_1400_tools.const import GLB_EXTENSION, PICKLE_EXTENSION, TargetFormat
 from europa_1400_tools.construct.baf import Baf
 from europa_1400_tools.construct.bgf import Bgf
-from europa_1400_tools.converter.bgf_converter import BgfConverter
+from europa_1400_tools.converter._conversion_cache import paths_digest
+from europa_1400_tools.converter.bgf_converter import BgfConverter, parse_bgf
 from europa_1400_tools.decoder.commands import decode_animations, decode_objects
 from europa_1400_tools.extractor.commands import extract_file
-from europa_1400_tools.helpers import bitmap_to_gltf_uri, bytes_to_gltf_uri
+from europa_1400_tools.helpers import bitmap_to_gltf_uri
 from europa_1400_tools.mapper.commands import map_animations
 
+CORNER_DTYPE = np.dtype([("vertex_index", "<u4"), ("u", "<f4"), ("v", "<f4")])
+KHR_MESH_QUANTIZATION = "KHR_mesh_quantization"
+
 
 @dataclass
 class GltfPrimitive:
@@ -53,6 +58,7 @@ class GltfPrimitive:
     normals: np.ndarray
     uvs: np.ndarray
     indices: np.ndarray
+    indices_type: int
     texture_index: int
 
 
@@ -64,9 +70,136 @@ class GltfMesh:
     primitives: list[GltfPrimitive]
 
 
+def _deduplicate_corners(
+    faces: np.ndarray, face_uvs: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Merge face corners sharing the same vertex and uv coordinates.
+
+    Return the index of the merged corner for each face corner, the uv
+    coordinates of the merged corners and the vertex index they refer to.
+    """
+
+    corners = np.empty(faces.size, dtype=CORNER_DTYPE)
+    corners["vertex_index"] = faces.reshape(-1)
+    corners["u"] = face_uvs[..., 0].reshape(-1)
+    corners["v"] = face_uvs[..., 1].reshape(-1)
+
+    unique_corners, corner_indices = np.unique(corners, return_inverse=True)
+    uvs = np.stack([unique_corners["u"], unique_corners["v"]], axis=1)
+
+    return corner_indices, uvs, unique_corners["vertex_index"]
+
+
+def _optimize_vertex_fetch(indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Renumber vertices in the order of their first use by the indices.
+
+    Return the renumbered indices and the previous index of each vertex.
+    """
+
+    _, first_uses = np.unique(indices, return_index=True)
+    vertex_order = np.argsort(first_uses)
+
+    remap = np.empty_like(vertex_order)
+    remap[vertex_order] = np.arange(len(vertex_order))
+
+    return remap[indices], vertex_order
+
+
+def _quantize_uvs(uvs: np.ndarray) -> np.ndarray | None:
+    """Quantize uv coordinates to normalized unsigned shorts.
+
+    Return None if the uv coordinates exceed the range of [0, 1].
+    """
+
+    if uvs.size == 0 or uvs.min() < 0.0 or uvs.max() > 1.0:
+        return None
+
+    return np.round(uvs * np.iinfo(np.uint16).max).astype(np.uint16)
+
+
+def _quantize_normals(normals: np.ndarray) -> np.ndarray:
+    """Quantize normals to normalized bytes.
+
+    The normals are padded to four components, as the vertex attributes of
+    gltf have to be aligned to 4 bytes.
+    """
+
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    unit_normals = np.divide(
+        normals, lengths, out=np.zeros_like(normals), where=lengths > 0.0
+    )
+
+    normals_q = np.zeros((len(normals), 4), dtype=np.int8)
+    normals_q[:, :3] = np.round(np.nan_to_num(unit_normals) * np.iinfo(np.int8).max)
+
+    return normals_q
+
+
+def _write_glb(gltf: GLTF2, bin_blob: bytearray, output_path: Path) -> None:
+    """Write the gltf and its binary blob as a GLB file.
+
+    The chunks are written one after another instead of assembling the whole
+    file in memory first.
+    """
+
+    json_bytes = gltf.gltf_to_json(separators=(",", ":"), indent=None).encode()
+
+    # both chunks have to be aligned to 4 bytes
+    json_bytes += b" " * (-len(json_bytes) % 4)
+    bin_padding = b"\x00" * (-len(bin_blob) % 4)
+    bin_length = len(bin_blob) + len(bin_padding)
+
+    total_length = 12 + 8 + len(json_bytes)
+    if bin_blob:
+        total_length += 8 + bin_length
+
+    with open(output_path, "wb") as output_file:
+        output_file.write(b"glTF" + struct.pack("<II", 2, total_length))
+        output_file.write(struct.pack("<I", len(json_bytes)) + b"JSON")
+        output_file.write(json_bytes)
+
+        if bin_blob:
+            output_file.write(struct.pack("<I", bin_length) + b"BIN\x00")
+            output_file.write(memoryview(bin_blob))
+            output_file.write(bin_padding)
+
+
+@functools.lru_cache(maxsize=256)
+def _texture_uri_cached(texture_path: Path, _mtime_ns: int) -> str:
+    """Encode a texture as data uri, the modification time only keys the cache."""
+
+    return bitmap_to_gltf_uri(texture_path)
+
+
+def _texture_uri(texture_path: Path) -> str:
+    """Encode a texture as data uri, reusing the results of unchanged textures."""
+
+    return _texture_uri_cached(texture_path, texture_path.stat().st_mtime_ns)
+
+
+# animations are shared by several objects, which are converted in any order
+@functools.lru_cache(maxsize=16)
+def _load_baf_cached(baf_path: Path, _mtime_ns: int) -> Baf:
+    """Load a decoded BAF file, the modification time only keys the cache."""
+
+    with open(baf_path, "rb") as input_file:
+        return pickle.load(input_file)
+
+
+def _load_baf(baf_path: Path) -> Baf:
+    """Load a decoded BAF file, reusing the result while the file is unchanged."""
+
+    return _load_baf_cached(baf_path, baf_path.stat().st_mtime_ns)
+
+
 class BgfGltfConverter(BgfConverter):
     """Class for converting BGF files to gLTF."""
 
+    baf_to_bgfs: dict[Path, list[Path]]
+    bgf_to_bafs: defaultdict[str, list[Path]]
+    _bin_blob: bytearray
+    _accessor_cache: dict[tuple, int]
+
     def __init__(self, common_options):
         super().__init__(common_options)
 
@@ -105,6 +238,52 @@ class BgfGltfConverter(BgfConverter):
                     self.decoded_animations_paths,
                 )
 
+            # index the mapped animations by the lowercase name of their objects
+            self.bgf_to_bafs = defaultdict(list)
+            for baf_path, bgf_paths in self.baf_to_bgfs.items():
+                for bgf_path in bgf_paths:
+                    baf_paths = self.bgf_to_bafs[bgf_path.stem.lower()]
+                    if baf_path not in baf_paths:
+                        baf_paths.append(baf_path)
+
+    def input_state(self) -> str:
+        """Return the state of the textures, animation mapping and animations."""
+
+        if self.common_options.target_format == TargetFormat.GLTF_STATIC:
+            return super().input_state()
+
+        mapping = sorted(
+            (bgf_name, sorted(str(baf_path) for baf_path in baf_paths))
+            for bgf_name, baf_paths in self.bgf_to_bafs.items()
+        )
+        mapping_digest = hashlib.sha1(
+            repr(mapping).encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+
+        # the mapping is loaded from or made from these files
+        mapping_input_paths = [
+            self.common_options.game_objects_path,
+            self.common_options.game_animations_path,
+            self.common_options.mapped_animations_path,
+        ]
+
+        decoded_animations_paths = {
+            (self.common_options.decoded_animations_path / baf_path).with_suffix(
+                PICKLE_EXTENSION
+            )
+            for baf_paths in self.bgf_to_bafs.values()
+            for baf_path in baf_paths
+        }
+
+        return "\n".join(
+            [
+                super().input_state(),
+                mapping_digest,
+                paths_digest(mapping_input_paths),
+                paths_digest(decoded_animations_paths),
+            ]
+        )
+
     def convert_bgf_file(
         self,
         file_path: Path,
@@ -113,26 +292,25 @@ class BgfGltfConverter(BgfConverter):
         target_format: TargetFormat,
         create_subdirectories: bool = False,
     ) -> list[Path]:
-        bgf = Bgf.from_file(file_path)
+        bgf = parse_bgf(file_path)
         name = bgf.path.stem
 
         gltf = GLTF2()
+        self._bin_blob = bytearray()
+        self._accessor_cache = {}
 
         bafs: list[Baf] = []
 
+        # objects only have a few animations, and files are already converted
+        # in parallel, so the animations are loaded one after another
         if target_format == TargetFormat.GLTF:
-            baf_paths = [
-                (self.common_options.decoded_animations_path / baf_path).with_suffix(
+            decoded_animations_path = self.common_options.decoded_animations_path
+
+            for baf_path in self.bgf_to_bafs.get(name.lower(), []):
+                baf_pickle_path = (decoded_animations_path / baf_path).with_suffix(
                     PICKLE_EXTENSION
                 )
-                for baf_path, bgfs in self.baf_to_bgfs.items()
-                if any(bgf_path.stem.lower() == name.lower() for bgf_path in bgfs)
-            ]
-
-            for baf_path in baf_paths:
-                with open(baf_path, "rb") as input_file:
-                    baf = pickle.load(input_file)
-                    bafs.append(baf)
+                bafs.append(_load_baf(baf_pickle_path))
 
         gltf_mesh = self._convert_mesh(bgf, bafs, name)
 
@@ -151,28 +329,17 @@ class BgfGltfConverter(BgfConverter):
         gltf.nodes.append(node)
 
         for i, gltf_primitive in enumerate(gltf_mesh.primitives):
-            primitive = Primitive(
-                attributes={
-                    "POSITION": len(gltf.accessors) + 1,
-                    "NORMAL": len(gltf.accessors) + 2,
-                    "TEXCOORD_0": len(gltf.accessors) + 3,
-                },
-                indices=len(gltf.accessors),
-                material=gltf_primitive.texture_index,
-            )
-            primitives.append(primitive)
-
-            self._add_gltf_data(
+            indices_id = self._add_gltf_data(
                 gltf=gltf,
                 data=gltf_primitive.indices,
                 buffer_type=ELEMENT_ARRAY_BUFFER,
-                data_type=UNSIGNED_INT,
+                data_type=gltf_primitive.indices_type,
                 data_format=SCALAR,
                 name=f"indices_{i}",
                 minmax=False,
             )
 
-            self._add_gltf_data(
+            vertices_id = self._add_gltf_data(
                 gltf=gltf,
                 data=gltf_primitive.vertices,
                 buffer_type=ARRAY_BUFFER,
@@ -181,33 +348,63 @@ class BgfGltfConverter(BgfConverter):
                 name=f"vertices_{i}",
             )
 
-            self._add_gltf_data(
+            # normalized byte normals require the mesh quantization extension
+            normals_id = self._add_gltf_data(
                 gltf=gltf,
-                data=gltf_primitive.normals,
+                data=_quantize_normals(gltf_primitive.normals),
                 buffer_type=ARRAY_BUFFER,
-                data_type=FLOAT,
+                data_type=BYTE,
                 data_format=VEC3,
                 name=f"vertex_normals_{i}",
+                minmax=False,
+                normalized=True,
+                byte_stride=4,
             )
 
-            self._add_gltf_data(
-                gltf=gltf,
-                data=gltf_primitive.uvs,
-                buffer_type=ARRAY_BUFFER,
-                data_type=FLOAT,
-                data_format=VEC2,
-                name=f"uv_coordinates_{i}",
+            uvs_q = _quantize_uvs(gltf_primitive.uvs)
+            if uvs_q is not None:
+                uvs_id = self._add_gltf_data(
+                    gltf=gltf,
+                    data=uvs_q,
+                    buffer_type=ARRAY_BUFFER,
+                    data_type=UNSIGNED_SHORT,
+                    data_format=VEC2,
+                    name=f"uv_coordinates_{i}",
+                    minmax=False,
+                    normalized=True,
+                )
+            else:
+                uvs_id = self._add_gltf_data(
+                    gltf=gltf,
+                    data=gltf_primitive.uvs,
+                    buffer_type=ARRAY_BUFFER,
+                    data_type=FLOAT,
+                    data_format=VEC2,
+                    name=f"uv_coordinates_{i}",
+                )
+
+            primitive = Primitive(
+                attributes={
+                    "POSITION": vertices_id,
+                    "NORMAL": normals_id,
+                    "TEXCOORD_0": uvs_id,
+                },
+                indices=indices_id,
+                material=gltf_primitive.texture_index,
             )
+            primitives.append(primitive)
 
             total_vertices_per_key: np.ndarray = (
                 np.concatenate(gltf_primitive.baf_to_vertices_per_key)
                 if gltf_primitive.baf_to_vertices_per_key
-                else np.array([])
+                else np.empty((0, *gltf_primitive.vertices.shape), dtype=np.float32)
             )
 
-            for j, anim_vertices in enumerate(total_vertices_per_key):
-                relative_anim_vertices = anim_vertices - gltf_primitive.vertices
-                self._add_gltf_data(
+            # morph targets are stored relative to the base vertices
+            relative_vertices_per_key = total_vertices_per_key - gltf_primitive.vertices
+
+            for j, relative_anim_vertices in enumerate(relative_vertices_per_key):
+                anim_vertices_id = self._add_gltf_data(
                     gltf=gltf,
                     data=relative_anim_vertices,
                     buffer_type=ARRAY_BUFFER,
@@ -218,7 +415,7 @@ class BgfGltfConverter(BgfConverter):
 
                 primitive.targets.append(
                     Attributes(
-                        POSITION=len(gltf.accessors) - 1,
+                        POSITION=anim_vertices_id,
                     )
                 )
 
@@ -227,20 +424,15 @@ class BgfGltfConverter(BgfConverter):
         missing_texture_indices: list[int] = []
 
         for i, texture_name in enumerate(texture_names):
-            texture_path: Path | None = None
-            for extracted_textures_path in self.extracted_textures_paths:
-                if (
-                    extracted_textures_path.stem.lower()
-                    == Path(texture_name).stem.lower()
-                ):
-                    texture_path = extracted_textures_path
-                    break
+            texture_path = self.extracted_textures_by_name.get(
+                Path(texture_name).stem.lower()
+            )
 
             if texture_path is None:
                 missing_texture_indices.append(i)
                 continue
 
-            texture_uri = bitmap_to_gltf_uri(texture_path)
+            texture_uri = _texture_uri(texture_path)
 
             gltf.images.append(
                 Image(
@@ -286,76 +478,16 @@ class BgfGltfConverter(BgfConverter):
                 )
             )
 
-        target_index = 0
-
-        if len(bafs) > 0:
-            total_keyframe_count = len(total_vertices_per_key)
-
-            bafs = bafs[:1]
-            for baf in bafs:
-                keyframe_count = baf.keyframe_count
-
-                weight_values = []
-                for i in range(keyframe_count):
-                    weight_values.append([0.0] * total_keyframe_count)
-                    weight_values[-1][target_index + i] = 1.0
-
-                weight_values_flattened = np.array(
-                    weight_values, dtype=np.float32
-                ).flatten()
-
-                self._add_gltf_data(
-                    gltf=gltf,
-                    data=weight_values_flattened,
-                    data_type=FLOAT,
-                    data_format=SCALAR,
-                    name="weight_values",
-                    minmax=False,
-                )
-                weight_values_id = len(gltf.accessors) - 1
+        if gltf.meshes[0].primitives:
+            gltf.extensionsUsed.append(KHR_MESH_QUANTIZATION)
+            gltf.extensionsRequired.append(KHR_MESH_QUANTIZATION)
 
-                time_values: np.ndarray = np.arange(0, keyframe_count, dtype=np.float32)
-                if baf.baf_ini is not None and baf.baf_ini.key_times is not None:
-                    time_values = np.array(
-                        baf.baf_ini.key_times,
-                        dtype=np.float32,
-                    )
-
-                self._add_gltf_data(
-                    gltf=gltf,
-                    data=time_values,
-                    data_type=FLOAT,
-                    data_format=SCALAR,
-                    name="time_values",
-                )
-                time_values_id = len(gltf.accessors) - 1
-
-                animation = Animation(
-                    name=baf.path.stem.lower(),
-                    samplers=[
-                        AnimationSampler(
-                            input=time_values_id,
-                            interpolation=ANIM_LINEAR,
-                            output=weight_values_id,
-                        ),
-                    ],
-                    channels=[
-                        AnimationChannel(
-                            sampler=0,
-                            target=AnimationChannelTarget(
-                                node=0,
-                                path=WEIGHTS,
-                            ),
-                        ),
-                    ],
-                )
-                continue
-                gltf.animations.append(animation)
+        glb_output_path = output_path / Path(name).with_suffix(GLB_EXTENSION)
 
-                target_index += keyframe_count
+        if self._bin_blob:
+            gltf.buffers.append(Buffer(byteLength=len(self._bin_blob)))
 
-        glb_output_path = output_path / Path(name).with_suffix(GLB_EXTENSION)
-        gltf.save_binary(glb_output_path)
+        _write_glb(gltf, self._bin_blob, glb_output_path)
 
         return [glb_output_path]
 
@@ -368,22 +500,39 @@ class BgfGltfConverter(BgfConverter):
         name: str = "",
         minmax: bool = True,
         buffer_type: int | None = None,
-    ) -> tuple[Buffer, BufferView, Accessor]:
-        data_bytes = data.tobytes()
-
-        data_buffer = Buffer(
-            byteLength=len(data_bytes),
-            uri=bytes_to_gltf_uri(data_bytes),
-            extras={
-                "name": name,
-            },
+        normalized: bool = False,
+        byte_stride: int | None = None,
+    ) -> int:
+        """Add data to the gltf and return the index of its accessor."""
+
+        # view the data as bytes without copying it
+        data_bytes = np.ascontiguousarray(data).data.cast("B")
+
+        # reuse the accessor of identical data
+        cache_key = (
+            data_type,
+            data_format,
+            buffer_type,
+            minmax,
+            normalized,
+            byte_stride,
+            data.shape,
+            hashlib.blake2b(data_bytes, digest_size=16).digest(),
         )
-        gltf.buffers.append(data_buffer)
+        cached_accessor = self._accessor_cache.get(cache_key)
+        if cached_accessor is not None:
+            return cached_accessor
+
+        # align the data to 4 bytes within the binary blob
+        self._bin_blob += b"\x00" * (-len(self._bin_blob) % 4)
+        byte_offset = len(self._bin_blob)
+        self._bin_blob += data_bytes
 
         data_buffer_view = BufferView(
-            buffer=len(gltf.buffers) - 1,
+            buffer=0,
             byteLength=len(data_bytes),
-            byteOffset=0,
+            byteOffset=byte_offset,
+            byteStride=byte_stride,
             target=buffer_type,
             extras={
                 "name": name,
@@ -395,17 +544,14 @@ class BgfGltfConverter(BgfConverter):
         max: list[float] | None = None
 
         if minmax:
-            if data.ndim == 1:
-                min = [float(np.min(data))]
-                max = [float(np.max(data))]
-            else:
-                min = [float(np.min(data[:, i])) for i in range(data.shape[1])]
-                max = [float(np.max(data[:, i])) for i in range(data.shape[1])]
+            min = np.atleast_1d(data.min(axis=0)).astype(float).tolist()
+            max = np.atleast_1d(data.max(axis=0)).astype(float).tolist()
 
         data_accessor = Accessor(
             bufferView=len(gltf.bufferViews) - 1,
             byteOffset=0,
             componentType=data_type,
+            normalized=normalized,
             count=len(data),
             type=data_format,
             min=min,
@@ -416,7 +562,10 @@ class BgfGltfConverter(BgfConverter):
         )
         gltf.accessors.append(data_accessor)
 
-        return data_buffer, data_buffer_view, data_accessor
+        accessor_id = len(gltf.accessors) - 1
+        self._accessor_cache[cache_key] = accessor_id
+
+        return accessor_id
 
     def _convert_mesh(self, bgf: Bgf, bafs: list[Baf], name: str) -> Mesh:
         """Convert Bgf to gltf mesh."""
@@ -427,142 +576,116 @@ class BgfGltfConverter(BgfConverter):
             primitives=gltf_primitives,
         )
 
-        texture_indices = set(
-            polygon.texture_index for polygon in bgf.mapping_object.polygons
-        )
+        vertex_mappings = bgf.mapping_object.vertex_mappings_array
+        polygons = bgf.mapping_object.polygons_array
 
-        bgf_vertices = np.array(
-            [
-                [
-                    vertex_mapping.vertex1.x,
-                    vertex_mapping.vertex1.y,
-                    -vertex_mapping.vertex1.z,
-                ]
-                for vertex_mapping in bgf.mapping_object.vertex_mappings
-            ],
-            dtype=np.float32,
+        # flip the z axis to convert into the gltf coordinate system
+        axis_flip = np.array([1.0, 1.0, -1.0], dtype=np.float32)
+        bgf_vertices = (
+            structured_to_unstructured(vertex_mappings["vertex1"]) * axis_flip
         )
+        bgf_normals = structured_to_unstructured(vertex_mappings["vertex2"]) * axis_flip
 
-        bgf_normals = np.array(
+        # reorder the corners of each face from a, b, c to a, c, b
+        corner_order = [0, 2, 1]
+        faces = structured_to_unstructured(polygons["face"])[:, corner_order]
+        face_uvs = np.stack(
             [
-                [
-                    vertex_mapping.vertex2.x,
-                    vertex_mapping.vertex2.y,
-                    -vertex_mapping.vertex2.z,
-                ]
-                for vertex_mapping in bgf.mapping_object.vertex_mappings
+                structured_to_unstructured(polygons["texture_mapping"]["vertex_u"]),
+                structured_to_unstructured(polygons["texture_mapping"]["vertex_v"]),
             ],
-            dtype=np.float32,
+            axis=2,
+        )[:, corner_order]
+        texture_indices = polygons["texture_index"]
+
+        baf_to_bgf_vertices_per_key = [
+            baf.get_vertices_per_key() * axis_flip for baf in bafs
+        ]
+
+        # group the faces by their texture index
+        face_order = np.argsort(texture_indices, kind="stable")
+        unique_texture_indices, group_starts = np.unique(
+            texture_indices[face_order], return_index=True
         )
-
-        baf_to_bgf_vertices_per_key = []
-        for baf in bafs:
-            bgf_vertices_per_key = baf.get_vertices_per_key()
-            baf_to_bgf_vertices_per_key.append(bgf_vertices_per_key)
+        face_groups = np.split(face_order, group_starts[1:])
 
         # iterate over all textures
-        for texture_index in texture_indices:
+        for texture_index, rows in zip(unique_texture_indices.tolist(), face_groups):
             # skip indices of missing textures
             if texture_index >= len(bgf.footer.texture_names):
                 continue
 
             # each texture has its own primitive
-            # with its own indices, vertices, normals and uvs
-            primitive_indices: list = []
-            vertices: list = []
-            normals: list = []
-            uvs: list = []
-
-            # each texture also has its own animation vertices
-            vertices_per_key_per_anim = []
-            for bgf_vertices_per_key in baf_to_bgf_vertices_per_key:
-                vertices_per_key = np.empty_like(bgf_vertices_per_key, dtype=np.float32)
-                vertices_per_key_per_anim.append(vertices_per_key)
-
-            # select all indices with the current texture index
-            indices_per_polygon = np.array(
-                [
-                    [
-                        polygon.face.a,
-                        polygon.face.c,
-                        polygon.face.b,
-                    ]
-                    for polygon in bgf.mapping_object.polygons
-                    if polygon.texture_index == texture_index
-                ]
-            )
-            uvs_per_polygon = np.array(
-                [
-                    [
-                        [
-                            polygon.texture_mapping.a.u,
-                            polygon.texture_mapping.a.v,
-                        ],
-                        [
-                            polygon.texture_mapping.c.u,
-                            polygon.texture_mapping.c.v,
-                        ],
-                        [
-                            polygon.texture_mapping.b.u,
-                            polygon.texture_mapping.b.v,
-                        ],
-                    ]
-                    for polygon in bgf.mapping_object.polygons
-                    if polygon.texture_index == texture_index
-                ]
-            )
-
-            vertex_dict = {}
-
-            # iterate
-            for face, uvs_per_face in zip(indices_per_polygon, uvs_per_polygon):
-                for vertex_index, uv in zip(face, uvs_per_face):
-                    key = (vertex_index, uv[0], uv[1])
-
-                    if key not in vertex_dict:
-                        vertex_dict[key] = len(vertices)
-                        vertex = bgf_vertices[vertex_index]
-                        vertices.append(vertex)
-                        normals.append(bgf_normals[vertex_index])
-                        uvs.append(uv)
-
-                        for bgf_vertices_per_key, vertices_per_key in zip(
-                            baf_to_bgf_vertices_per_key, vertices_per_key_per_anim
-                        ):
-                            for keyframe in range(bgf_vertices_per_key.shape[0]):
-                                vertex_per_key = bgf_vertices_per_key[keyframe][
-                                    vertex_index
-                                ]
-                                vertices_per_key = np.append(
-                                    vertices_per_key, vertex_per_key
-                                )
-
-                    index = vertex_dict[key]
-                    primitive_indices.append(index)
-
-            primitive_indices_np = np.array(primitive_indices, dtype=np.uint32)
-            vertices_np = np.array(vertices, dtype=np.float32)
-            normals_np = np.array(normals, dtype=np.float32)
-            uvs_np = np.array(uvs, dtype=np.float32)
-
-            for vertices_per_key in vertices_per_key_per_anim:
-                vertices_per_key = np.array(vertices_per_key, dtype=np.float32)
-
-            if np.isnan(uvs_np).any():
-                uvs_np = np.nan_to_num(uvs_np)
-
-            for vertices_per_key in vertices_per_key_per_anim:
-                if np.isnan(vertices_per_key).any():
-                    raise ValueError("vertices_per_key contains nan")
-
-            gltf_primitive = GltfPrimitive(
-                indices=primitive_indices_np,
-                vertices=vertices_np,
-                baf_to_vertices_per_key=vertices_per_key_per_anim,
-                normals=normals_np,
-                uvs=uvs_np,
-                texture_index=texture_index,
+            gltf_primitive = self._calculate_primitive(
+                texture_index,
+                rows,
+                faces,
+                face_uvs,
+                bgf_vertices,
+                bgf_normals,
+                baf_to_bgf_vertices_per_key,
             )
             gltf_primitives.append(gltf_primitive)
 
         return gltf_mesh
+
+    @staticmethod
+    def _calculate_primitive(
+        texture_index: int,
+        rows: np.ndarray,
+        faces: np.ndarray,
+        face_uvs: np.ndarray,
+        vertices: np.ndarray,
+        normals: np.ndarray,
+        baf_to_vertices_per_key: list[np.ndarray],
+    ) -> GltfPrimitive:
+        """Calculate the primitive of all faces using the given texture."""
+
+        # select all faces with the current texture index
+        selected_faces = faces[rows]
+        selected_face_uvs = face_uvs[rows]
+
+        corner_indices, uvs_np, vertex_indices = _deduplicate_corners(
+            selected_faces, selected_face_uvs
+        )
+
+        # store the vertices in the order they are first used by the faces
+        corner_indices, vertex_order = _optimize_vertex_fetch(corner_indices)
+        uvs_np = uvs_np[vertex_order]
+        vertex_indices = vertex_indices[vertex_order]
+
+        # gather each output into a single contiguous array
+        vertices_np = np.ascontiguousarray(vertices[vertex_indices], dtype=np.float32)
+
+        # the maximum value of the index type is reserved by gltf
+        if len(vertices_np) < np.iinfo(np.uint16).max:
+            primitive_indices_np = corner_indices.astype(np.uint16)
+            indices_type = UNSIGNED_SHORT
+        else:
+            primitive_indices_np = corner_indices.astype(np.uint32, copy=False)
+            indices_type = UNSIGNED_INT
+        normals_np = np.ascontiguousarray(normals[vertex_indices], dtype=np.float32)
+
+        # each texture also has its own animation vertices
+        vertices_per_key_per_anim = [
+            vertices_per_key[:, vertex_indices]
+            for vertices_per_key in baf_to_vertices_per_key
+        ]
+
+        uvs_np = np.ascontiguousarray(uvs_np, dtype=np.float32)
+        if np.isnan(uvs_np).any():
+            uvs_np = np.nan_to_num(uvs_np)
+
+        for vertices_per_key in vertices_per_key_per_anim:
+            if np.isnan(vertices_per_key).any():
+                raise ValueError("vertices_per_key contains nan")
+
+        return GltfPrimitive(
+            indices=primitive_indices_np,
+            indices_type=indices_type,
+            vertices=vertices_np,
+            baf_to_vertices_per_key=vertices_per_key_per_anim,
+            normals=normals_np,
+            uvs=uvs_np,
+            texture_index=texture_index,
+        )
@@ -5,7 +5,7 @@ from pathlib import Path
 from europa_1400_tools.const import MTL_EXTENSION, OBJ_EXTENSION, TargetFormat
 from europa_1400_tools.construct.baf import Vector3
 from europa_1400_tools.construct.bgf import Bgf, BgfModel, Face, TextureMapping
-from europa_1400_tools.converter.bgf_converter import BgfConverter
+from europa_1400_tools.converter.bgf_converter import BgfConverter, parse_bgf
 
 
 class BgfWavefrontConverter(BgfConverter):
@@ -23,7 +23,7 @@ class BgfWavefrontConverter(BgfConverter):
         obj_output_path = output_path / Path(name).with_suffix(OBJ_EXTENSION)
         mtl_output_path = output_path / Path(name).with_suffix(MTL_EXTENSION)
 
-        bgf = Bgf.from_file(file_path)
+        bgf = parse_bgf(file_path)
 
         name, (obj_string, mtl_string) = self.convert_bgf_to_wavefront(bgf)
 
@@ -34,10 +34,11 @@ class BgfWavefrontConverter(BgfConverter):
             mtl_file.write(mtl_string)
 
         texture_names = [Path(texture.name).stem.lower() for texture in bgf.textures]
+        texture_names_set = set(texture_names)
         texture_paths = [
             texture_path
             for texture_path in self.extracted_textures_paths
-            if texture_path.stem.lower() in texture_names
+            if texture_path.stem.lower() in texture_names_set
         ]
 
         if len(texture_paths) != len(texture_names):
@@ -1,8 +1,12 @@
 """Commands for converting files"""
 
+import importlib
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Annotated, List, Optional
+from typing import Annotated, Iterator, List, Optional, cast
 
 import typer
 
@@ -13,28 +17,195 @@ from europa_1400_tools.const import (
     SourceFormat,
     TargetFormat,
     TyperTargetFormat,
+    classify,
 )
-from europa_1400_tools.converter.ageb_converter import AGebConverter
-from europa_1400_tools.converter.aobj_converter import AObjConverter
-from europa_1400_tools.converter.base_converter import BaseConverter
-from europa_1400_tools.converter.bgf_gltf_converter import BgfGltfConverter
-from europa_1400_tools.converter.bgf_wavefront_converter import BgfWavefrontConverter
-from europa_1400_tools.converter.ed3_converter import Ed3Converter
-from europa_1400_tools.converter.gfx_converter import GfxConverter
-from europa_1400_tools.converter.ogr_converter import OgrConverter
-from europa_1400_tools.converter.sbf_converter import SbfConverter
+from europa_1400_tools.converter._parallel import discard_executors
+from europa_1400_tools.converter.base_converter import BaseConverter, ConverterType
+from europa_1400_tools.converter.multi_converter import MultiConverter
 from europa_1400_tools.extractor.commands import extract_file
-from europa_1400_tools.helpers import get_files
+from europa_1400_tools.helpers import iter_files
 from europa_1400_tools.models import CommonOptions
 
 app = typer.Typer()
 
+# converters are expensive to set up, so reuse them within the process
+_CONVERTER_CACHE: dict[tuple, BaseConverter] = {}
+
+
+def _load_converter(module_name: str, class_name: str) -> type[BaseConverter]:
+    """Import a converter class on first use.
+
+    The converter modules pull in heavy dependencies like numpy and pygltflib,
+    so they are only imported when files of their format are converted.
+    """
+
+    module = importlib.import_module(f"europa_1400_tools.converter.{module_name}")
+    return getattr(module, class_name)
+
+
+def _get_converter(
+    converter_class: type[ConverterType], common_options: CommonOptions
+) -> ConverterType:
+    """Return the cached converter for the common options."""
+
+    key = (converter_class, common_options)
+
+    converter = _CONVERTER_CACHE.get(key)
+
+    # the inputs may have changed since the converter was set up, e.g. while
+    # serving conversions, which leaves its indexes and caches stale
+    if converter is not None and converter.input_state() != converter.cache_inputs:
+        _discard_converter(converter)
+        converter = None
+
+    if converter is None:
+        converter = _CONVERTER_CACHE[key] = converter_class(common_options)
+        converter.cache_inputs = converter.input_state()
+
+    return cast(ConverterType, converter)
+
+
+def _discard_converter(converter: BaseConverter) -> None:
+    """Forget the converter and the converters combining it with others."""
+
+    for key, cached_converter in list(_CONVERTER_CACHE.items()):
+        if cached_converter is converter or (
+            isinstance(cached_converter, MultiConverter)
+            and any(
+                combined_converter is converter
+                for combined_converter, _, _ in cached_converter.converters
+            )
+        ):
+            del _CONVERTER_CACHE[key]
+            discard_executors(cached_converter)
+
+
+# converter module, converter class and output path attribute of the common
+# options per source format and the target formats the converter handles, adding
+# a format only takes another row
+_CONVERTER_TABLE: list[tuple[SourceFormat, tuple[TargetFormat, ...], str, str, str]] = [
+    (
+        SourceFormat.AOBJ,
+        (TargetFormat.JSON,),
+        "aobj_converter",
+        "AObjConverter",
+        "converted_path",
+    ),
+    (
+        SourceFormat.AGEB,
+        (TargetFormat.JSON,),
+        "ageb_converter",
+        "AGebConverter",
+        "converted_path",
+    ),
+    (
+        SourceFormat.OGR,
+        (TargetFormat.JSON,),
+        "ogr_converter",
+        "OgrConverter",
+        "converted_groups_path",
+    ),
+    (
+        SourceFormat.GFX,
+        (TargetFormat.PNG,),
+        "gfx_converter",
+        "GfxConverter",
+        "converted_gfx_path",
+    ),
+    (
+        SourceFormat.SBF,
+        (TargetFormat.WAV, TargetFormat.MP3),
+        "sbf_converter",
+        "SbfConverter",
+        "converted_sfx_path",
+    ),
+    (
+        SourceFormat.ED3,
+        (TargetFormat.JSON,),
+        "ed3_converter",
+        "Ed3Converter",
+        "converted_scenes_path",
+    ),
+    (
+        SourceFormat.BGF,
+        (TargetFormat.WAVEFRONT,),
+        "bgf_wavefront_converter",
+        "BgfWavefrontConverter",
+        "converted_objects_path",
+    ),
+    (
+        SourceFormat.BGF,
+        (TargetFormat.GLTF, TargetFormat.GLTF_STATIC),
+        "bgf_gltf_converter",
+        "BgfGltfConverter",
+        "converted_objects_path",
+    ),
+]
+
+# converter module, class and output path attribute per source and target format
+_FORMAT_DISPATCH: dict[tuple[SourceFormat, TargetFormat], tuple[str, str, str]] = {
+    (source_format, target_format): (module_name, class_name, output_path_attribute)
+    for (
+        source_format,
+        target_formats,
+        module_name,
+        class_name,
+        output_path_attribute,
+    ) in _CONVERTER_TABLE
+    for target_format in target_formats
+}
+
+
+def _get_multi_converter(
+    common_options: CommonOptions,
+    converters: list[tuple[BaseConverter, TargetFormat, Path]],
+) -> BaseConverter:
+    """Return the cached converter combining the converters."""
+
+    key = (MultiConverter, common_options, tuple(converters))
+
+    converter = _CONVERTER_CACHE.get(key)
+    if converter is None:
+        converter = _CONVERTER_CACHE[key] = MultiConverter(common_options, converters)
+
+    return converter
+
+
+def _iter_source_files(
+    paths: list[Path], common_options: CommonOptions
+) -> Iterator[tuple[Path, Path]]:
+    """Yield the base path and path of all files to convert."""
+
+    def get_extracted_path(path: Path) -> Path:
+        return common_options.extracted_path / path.stem
+
+    # extract all archives in the background while the directories are walked
+    with ThreadPoolExecutor() as executor:
+        extractions = {
+            path: executor.submit(extract_file, path, get_extracted_path(path))
+            for path in paths
+            if path.suffix == BIN_EXTENSION and not path.is_dir()
+        }
+
+        for path in paths:
+            if path.is_dir():
+                for file_path in iter_files(path):
+                    yield path, file_path
+            elif path in extractions:
+                for file_path in extractions[path].result():
+                    yield get_extracted_path(path), file_path
+            else:
+                yield path.parent, path
+
 
 @app.callback(invoke_without_command=True)
 def convert(
     ctx: typer.Context,
-    typer_target_format: Optional[TyperTargetFormat] = typer.Option(
-        None, "--target-format", "-t"
+    typer_target_formats: Optional[List[TyperTargetFormat]] = typer.Option(
+        None,
+        "--target-format",
+        "-t",
+        help="Target formats, can be given multiple times.",
     ),
     create_subdirectories: bool = typer.Option(False, "--create-subdirectories", "-c"),
     paths: Annotated[
@@ -45,116 +216,124 @@ def convert(
 
     common_options: CommonOptions = ctx.obj
 
-    base_path_to_file_paths: dict[Path, list[Path]] = {}
+    convert_paths(
+        common_options,
+        paths,
+        [typer_target_format.value for typer_target_format in typer_target_formats]
+        if typer_target_formats
+        else None,
+        create_subdirectories,
+    )
 
-    if not paths:
-        paths = [common_options.game_path / path for path in CONVERTIBLE_PATHS]
 
-    for path in paths:
-        if path.is_dir():
-            if path not in base_path_to_file_paths.keys():
-                base_path_to_file_paths[path] = []
+def convert_paths(
+    common_options: CommonOptions,
+    paths: list[Path] | None = None,
+    typer_target_formats: list[str] | None = None,
+    create_subdirectories: bool = False,
+) -> list[Path]:
+    """Convert the files and directories and return the output paths."""
 
-            base_path_to_file_paths[path].extend(get_files(path))
-        elif path.suffix == BIN_EXTENSION:
-            extracted_path = common_options.extracted_path / path.stem
+    # resolve the target formats once, before any files are walked
+    requested_target_formats: list[TargetFormat] = []
+    for typer_target_format in typer_target_formats or []:
+        target_format = TargetFormat.from_typer(typer_target_format)
+        if target_format is None:
+            raise typer.BadParameter(f"Invalid target format: {typer_target_format}")
 
-            if extracted_path not in base_path_to_file_paths.keys():
-                base_path_to_file_paths[extracted_path] = []
+        if target_format in requested_target_formats:
+            continue
 
-            base_path_to_file_paths[extracted_path].extend(
-                extract_file(path, extracted_path)
-            )
-        else:
-            if path not in base_path_to_file_paths.keys():
-                base_path_to_file_paths[path.parent] = []
+        # target formats sharing their extension would overwrite each other
+        for requested_target_format in requested_target_formats:
+            if requested_target_format.extension == target_format.extension:
+                raise typer.BadParameter(
+                    f"Target formats {requested_target_format} and {target_format} "
+                    + "cannot be converted to at once"
+                )
 
-            base_path_to_file_paths[path.parent].append(path)
+        requested_target_formats.append(target_format)
 
-    format_to_file_paths: dict[SourceFormat, dict[Path, list[Path]]] = {}
+    if not paths:
+        paths = [common_options.game_path / path for path in CONVERTIBLE_PATHS]
+
+    format_to_file_paths: defaultdict[
+        SourceFormat, defaultdict[Path, list[Path]]
+    ] = defaultdict(lambda: defaultdict(list))
+
+    # files of unknown formats are reported once per extension after the walk
+    suffix_to_unknown_file_paths: defaultdict[str, list[Path]] = defaultdict(list)
+
+    for base_path, file_path in _iter_source_files(paths, common_options):
+        # most files are identified by the extension of their name alone
+        source_format = classify(file_path.name)
 
-    for base_path, file_paths in base_path_to_file_paths.items():
-        for file_path in file_paths:
-            if file_path.suffix.lower() in IGNORED_EXTENSIONS:
+        if source_format is None:
+            suffix = file_path.suffix.lower()
+
+            if suffix in IGNORED_EXTENSIONS:
                 continue
 
             source_format = SourceFormat.from_path(file_path)
 
             if source_format is None:
-                suffix: str | None = (
-                    file_path.suffix.lower() if file_path.suffix else None
-                )
-                message: str = (
-                    f"Unknown file extension: {suffix}"
-                    if suffix
-                    else "Unknown file extension"
-                )
-                logging.warning(f"{message}: {file_path}")
-                logging.warning(f"Skipping {file_path}")
+                suffix_to_unknown_file_paths[suffix].append(file_path)
                 continue
 
-            if source_format not in format_to_file_paths:
-                format_to_file_paths[source_format] = {}
-
-            if base_path not in format_to_file_paths[source_format]:
-                format_to_file_paths[source_format][base_path] = []
+        format_to_file_paths[source_format][base_path].append(file_path)
 
-            format_to_file_paths[source_format][base_path].append(file_path)
+    for suffix, unknown_file_paths in suffix_to_unknown_file_paths.items():
+        logging.warning(
+            f"Skipping {len(unknown_file_paths)} files with unknown file extension "
+            + f"{suffix or '(none)'}, e.g. {unknown_file_paths[0]}"
+        )
 
     output_paths: list[Path] = []
     for source_format, _base_path_to_file_paths in format_to_file_paths.items():
-        for base_path, file_paths in _base_path_to_file_paths.items():
-            if typer_target_format is None:
-                target_format = source_format.target_formats[0]
-            else:
-                converted_target_format = TargetFormat.from_typer(
-                    typer_target_format.value
-                )
-                if converted_target_format is None:
-                    raise typer.BadParameter(
-                        f"Invalid target format: {typer_target_format.value}"
-                    )
-                target_format = converted_target_format
+        target_formats: list[TargetFormat] = []
 
-            if target_format not in source_format.target_formats:
+        if not requested_target_formats:
+            target_formats.append(source_format.target_formats[0])
+
+        for requested_target_format in requested_target_formats:
+            if requested_target_format not in source_format.target_formats:
                 logging.warning(
-                    f"Cannot convert {source_format} files to {target_format}"
+                    f"Cannot convert {source_format} files to "
+                    + f"{requested_target_format}"
                 )
                 continue
 
-            common_options.target_format = target_format
-
-            converter: BaseConverter
-
-            if source_format == SourceFormat.AOBJ:
-                converter = AObjConverter(common_options)
-                output_path = common_options.converted_path
-            elif source_format == SourceFormat.AGEB:
-                converter = AGebConverter(common_options)
-                output_path = common_options.converted_path
-            elif source_format == SourceFormat.OGR:
-                converter = OgrConverter(common_options)
-                output_path = common_options.converted_groups_path
-            elif source_format == SourceFormat.GFX:
-                converter = GfxConverter(common_options)
-                output_path = common_options.converted_gfx_path
-            elif source_format == SourceFormat.SBF:
-                converter = SbfConverter(common_options)
-                output_path = common_options.converted_sfx_path
-            elif source_format == SourceFormat.ED3:
-                converter = Ed3Converter(common_options)
-                output_path = common_options.converted_scenes_path
-            elif source_format == SourceFormat.BGF:
-                converter = (
-                    BgfGltfConverter(common_options)
-                    if target_format == TargetFormat.GLTF
-                    or target_format == TargetFormat.GLTF_STATIC
-                    else BgfWavefrontConverter(common_options)
-                )
-                output_path = common_options.converted_objects_path
-            else:
+            target_formats.append(requested_target_format)
+
+        converters: list[tuple[BaseConverter, TargetFormat, Path]] = []
+        for target_format in target_formats:
+            dispatch = _FORMAT_DISPATCH.get((source_format, target_format))
+            if dispatch is None:
                 continue
 
+            module_name, class_name, output_path_attribute = dispatch
+
+            format_options = replace(common_options, target_format=target_format)
+            converters.append(
+                (
+                    _get_converter(
+                        _load_converter(module_name, class_name), format_options
+                    ),
+                    target_format,
+                    getattr(format_options, output_path_attribute),
+                )
+            )
+
+        if not converters:
+            continue
+
+        converter, target_format, output_path = converters[0]
+
+        # convert each file to all target formats at once to share its parse
+        if len(converters) > 1:
+            converter = _get_multi_converter(common_options, converters)
+
+        for base_path, file_paths in _base_path_to_file_paths.items():
             output_paths.extend(
                 converter.convert(
                     file_paths,
@@ -165,3 +344,5 @@ def convert(
                     create_subdirectories,
                 )
             )
+
+    return output_paths
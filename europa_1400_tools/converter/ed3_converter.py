@@ -9,6 +9,9 @@ from europa_1400_tools.helpers import rebase_path
 class Ed3Converter(BaseConverter):
     """Convert Ed3 files."""
 
+    # scenes are parsed and serialized independently of each other
+    parallel_mode = "process"
+
     def convert_file(
         self,
         file_path: Path,
@@ -25,7 +28,7 @@ class Ed3Converter(BaseConverter):
         output_file_path = rebase_path(file_path, base_path, output_path).with_suffix(
             JSON_EXTENSION
         )
-        output_file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.make_directory(output_file_path.parent)
         output_file_path.write_text(ed3_json, encoding="utf-8")
 
         return [output_file_path]
@@ -1,6 +1,7 @@
 import logging
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
 from europa_1400_tools.const import PNG_EXTENSION, TargetFormat
@@ -11,6 +12,12 @@ from europa_1400_tools.converter.base_converter import BaseConverter
 class GfxConverter(BaseConverter):
     """Class for converting the GFX file."""
 
+    # graphics are decoded pixel by pixel
+    parallel_mode = "process"
+
+    # graphics files bundle many images each
+    prefetch = True
+
     def convert_file(
         self,
         file_path: Path,
@@ -34,8 +41,7 @@ class GfxConverter(BaseConverter):
         for name, images in shapebank_images.items():
             shapebank_output_path = output_path / name
 
-            if not shapebank_output_path.exists():
-                shapebank_output_path.mkdir(parents=True)
+            self.make_directory(shapebank_output_path)
 
             for image_name, image in images.items():
                 output_file_path = shapebank_output_path / Path(image_name).with_suffix(
@@ -69,45 +75,64 @@ class GfxConverter(BaseConverter):
         self,
         graphic: Graphic,
     ) -> Image.Image:
-        image = Image.new("RGBA", (graphic.width, graphic.height))
-
         if graphic.pixel_data:
-            pixel_data_rgb = graphic.pixel_data
-            pixel_data_rgba: list[int] = [
-                int.from_bytes(pixel_data_rgb[i : i + 3], "little") + 0xFF000000
-                for i in range(0, len(pixel_data_rgb), 3)
-            ]
-            image.putdata(pixel_data_rgba)
-            return image
+            pixel_data_rgb = np.frombuffer(graphic.pixel_data, dtype=np.uint8)
+            pixel_alpha = np.full(len(pixel_data_rgb) // 3, 0xFF, dtype=np.uint8)
+            return self._create_image(graphic, pixel_data_rgb, pixel_alpha)
 
         if graphic.graphic_rows:
-            const_transparent = int.from_bytes(b"\xFF\xFF\xFF\x00", "little")
-            image_data: list[int] = []
-            for i, graphic_row in enumerate(graphic.graphic_rows):
-                row_data: list[int] = []
-                for j, transparency_block in enumerate(graphic_row.transparency_blocks):
-                    block_data: list[int] = []
-                    for _ in range(transparency_block.size_transparent // 3):
-                        block_data += [const_transparent]
-                    pixel_data_rgba = [
-                        int.from_bytes(
-                            transparency_block.pixel_data[i : i + 3], "little"
-                        )
-                        + 0xFF000000
-                        for i in range(0, len(transparency_block.pixel_data), 3)
-                    ]
-                    block_data.extend(pixel_data_rgba)
-                    row_data.extend(block_data)
-                image_data.extend(row_data)
+            # transparent pixels are white without any opacity
+            rgb_parts: list[bytes] = []
+            alpha_parts: list[bytes] = []
+            for graphic_row in graphic.graphic_rows:
+                for transparency_block in graphic_row.transparency_blocks:
+                    transparent_count = transparency_block.size_transparent // 3
+                    pixel_count = len(transparency_block.pixel_data) // 3
+
+                    rgb_parts.append(b"\xFF\xFF\xFF" * transparent_count)
+                    alpha_parts.append(b"\x00" * transparent_count)
+                    rgb_parts.append(transparency_block.pixel_data)
+                    alpha_parts.append(b"\xFF" * pixel_count)
+
+            image_data_rgb = np.frombuffer(b"".join(rgb_parts), dtype=np.uint8)
+            image_alpha = np.frombuffer(b"".join(alpha_parts), dtype=np.uint8)
 
             length_check = graphic.width * graphic.height
-            length_actual = len(image_data)
+            length_actual = len(image_alpha)
             if length_check != length_actual:
                 logging.warning(
                     f"Graphic has incorrect length: {length_actual} "
-                    + "instead of {length_check}"
+                    + f"instead of {length_check}"
                 )
-            image.putdata(image_data)
-            return image
+            return self._create_image(graphic, image_data_rgb, image_alpha)
 
         raise ValueError("Graphic has no pixel data or graphic rows")
+
+    @staticmethod
+    def _create_image(
+        graphic: Graphic, pixel_data_rgb: np.ndarray, pixel_alpha: np.ndarray
+    ) -> Image.Image:
+        """Create an image from rgb and alpha values filling it row by row.
+
+        Pixels without data are left fully transparent black.
+        """
+
+        pixel_count = graphic.width * graphic.height
+        if len(pixel_alpha) > pixel_count:
+            raise ValueError("Graphic has more pixels than fit into its size")
+
+        pixels_rgba = np.zeros((pixel_count, 4), dtype=np.uint8)
+        pixels_rgba[: len(pixel_alpha), :3] = pixel_data_rgb[
+            : len(pixel_alpha) * 3
+        ].reshape(-1, 3)
+        pixels_rgba[: len(pixel_alpha), 3] = pixel_alpha
+
+        return Image.frombuffer(
+            "RGBA",
+            (graphic.width, graphic.height),
+            pixels_rgba.tobytes(),
+            "raw",
+            "RGBA",
+            0,
+            1,
+        )
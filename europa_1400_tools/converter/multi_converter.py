@@ -0,0 +1,72 @@
+"""Class for converting files to multiple target formats at once."""
+
+from pathlib import Path
+
+from europa_1400_tools.const import TargetFormat
+from europa_1400_tools.converter.base_converter import BaseConverter
+from europa_1400_tools.models import CommonOptions
+
+
+class MultiConverter(BaseConverter):
+    """Convert each file with multiple converters in turn.
+
+    Converters sharing a parse cache, like the BGF converters, only parse each
+    file once this way.
+    """
+
+    converters: list[tuple[BaseConverter, TargetFormat, Path]]
+
+    def __init__(
+        self,
+        common_options: CommonOptions,
+        converters: list[tuple[BaseConverter, TargetFormat, Path]],
+    ):
+        super().__init__(common_options)
+
+        self.converters = converters
+        self.parallel_mode = converters[0][0].parallel_mode
+        self.prefetch = converters[0][0].prefetch
+
+    @property
+    def cache_name(self) -> str:
+        """Return the name identifying the conversions in the cache."""
+
+        return ",".join(
+            f"{converter.cache_name}:{target_format}"
+            for converter, target_format, _ in self.converters
+        )
+
+    def input_state(self) -> str:
+        """Return the state of the inputs of all converters."""
+
+        return "\n".join(converter.input_state() for converter, _, _ in self.converters)
+
+    def convert_file(
+        self,
+        file_path: Path,
+        output_path: Path,
+        base_path: Path,
+        target_format: TargetFormat,
+        create_subdirectories: bool = False,
+    ) -> list[Path]:
+        """Convert file with all converters to their own output paths."""
+
+        output_paths: list[Path] = []
+
+        for (
+            converter,
+            converter_target_format,
+            converter_output_path,
+        ) in self.converters:
+            converted_file_paths = converter.convert_file(
+                file_path,
+                converter_output_path,
+                base_path,
+                converter_target_format,
+                create_subdirectories,
+            )
+
+            if converted_file_paths is not None:
+                output_paths.extend(converted_file_paths)
+
+        return output_paths
@@ -21,6 +21,9 @@ from europa_1400_tools.models import (
 class OgrConverter(BaseConverter):
     """Converter for OGR files."""
 
+    # the files are a few kilobytes each
+    read_in_batches = True
+
     def convert_file(
         self,
         file_path: Path,
@@ -30,7 +33,7 @@ class OgrConverter(BaseConverter):
         create_subdirectories: bool = False,
     ) -> list[Path]:
         name = file_path.stem
-        ogr = Ogr.from_file(file_path)
+        ogr = Ogr.from_bytes(self.read_file(file_path), file_path)
         ogr_elements_json: list[OgrElementJson] = []
 
         for group_element in ogr.group_elements:
@@ -138,7 +141,7 @@ class OgrConverter(BaseConverter):
         json_output_path = rebase_path(file_path.parent, base_path, output_path) / Path(
             name
         ).with_suffix(JSON_EXTENSION)
-        json_output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.make_directory(json_output_path.parent)
         json_output_path.write_text(ogr_json_text, encoding="utf-8")
 
         return [json_output_path]
@@ -13,6 +13,9 @@ from europa_1400_tools.helpers import rebase_path
 class SbfConverter(BaseConverter):
     """Class for converting SBF files."""
 
+    # sounds are mostly read, written and transcoded by ffmpeg
+    parallel_mode = "thread"
+
     def convert_file(
         self,
         file_path: Path,
@@ -69,8 +72,7 @@ class SbfConverter(BaseConverter):
                     / Path(name).with_suffix(target_format.extension)
                 )
 
-                if not audio_output_path.parent.exists():
-                    audio_output_path.parent.mkdir(parents=True)
+                self.make_directory(audio_output_path.parent)
 
                 with open(audio_output_path, "wb") as wav_output_file:
                     wav_output_file.write(audio_bytes)
@@ -125,6 +125,7 @@ def decode_animations(
             pickle.dump(
                 baf,
                 pickle_output_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
 
         pickle_output_paths.append(pickle_output_path)
@@ -187,6 +188,7 @@ def decode_objects(
             pickle.dump(
                 bgf,
                 pickle_output_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
 
         pickle_output_paths.append(pickle_output_path)
@@ -239,6 +241,7 @@ def decode_scenes(
             pickle.dump(
                 group,
                 pickle_output_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
 
         pickle_output_paths.append(pickle_output_path)
@@ -288,6 +291,7 @@ def decode_groups(
             pickle.dump(
                 group,
                 pickle_output_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
 
         pickle_output_paths.append(pickle_output_path)
@@ -321,6 +325,7 @@ def decode_ageb(
             pickle.dump(
                 building,
                 pickle_output_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
 
         pickle_output_paths.append(pickle_output_path)
@@ -354,6 +359,7 @@ def decode_aobj(
             pickle.dump(
                 object_data,
                 pickle_output_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
 
         pickle_output_paths.append(pickle_output_path)
@@ -406,6 +412,7 @@ def decode_gfx(
             pickle.dump(
                 shapebank_definition,
                 pickle_output_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
 
         if common_options.verbose:
@@ -453,6 +460,7 @@ def decode_sfx(
                 pickle.dump(
                     sbf,
                     pickle_output_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
                 )
 
         return pickle_output_paths
@@ -472,6 +480,7 @@ def decode_sfx(
             pickle.dump(
                 sbf,
                 pickle_output_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
 
         pickle_output_paths.append(pickle_output_path)
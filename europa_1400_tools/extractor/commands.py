@@ -1,6 +1,7 @@
 """Command line interface for europa_1400_tools."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -33,10 +34,15 @@ def extract(
             common_options.game_resources_path / bin_file for bin_file in BIN_FILES
         ]
 
-    for file_path in file_paths:
-        output_subdir = common_options.extracted_path / file_path.stem
-        extracted_paths = extract_file(file_path, output_subdir)
-        output_paths.extend(extracted_paths)
+    # the archives are decompressed and written concurrently
+    with ThreadPoolExecutor() as executor:
+        for extracted_paths in executor.map(
+            lambda file_path: extract_file(
+                file_path, common_options.extracted_path / file_path.stem
+            ),
+            file_paths,
+        ):
+            output_paths.extend(extracted_paths)
 
     return output_paths
 
@@ -47,8 +53,7 @@ def extract_file(file_path: Path, output_path: Path) -> list[Path]:
     if not file_path.exists():
         raise FileNotFoundError(f"File does not exist: {file_path}")
 
-    if not output_path.exists():
-        output_path.mkdir(parents=True)
+    output_path.mkdir(parents=True, exist_ok=True)
 
     logging.info(f"Extracting {file_path.name} to {output_path}.")
 
@@ -4,9 +4,11 @@ import os
 import re
 import struct
 import tkinter as tk
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog
-from typing import BinaryIO
+from typing import BinaryIO, Iterable, Iterator
 from zipfile import ZipFile
 
 import construct as cs
@@ -251,23 +253,120 @@ def extract_zipfile(input_path: Path, output_path: Path) -> list[Path]:
     return file_paths
 
 
-def get_files(
+def iter_files(
     path: Path, extension: str | None = None, exclude: list[Path] | None = None
-) -> list[Path]:
-    """Returns a list of files in the specified directory and its subdirectories."""
+) -> Iterator[Path]:
+    """Yields the files in the specified directory and its subdirectories."""
 
-    file_paths: list[Path] = []
+    excluded_paths = set(exclude) if exclude is not None else set()
 
-    for root, _, files in os.walk(path):
-        for file in files:
-            file_path = Path(root) / file
+    # scandir entries know their type without an extra stat call per file
+    directories: list[str | os.PathLike[str]] = [path]
 
-            if exclude is not None and file_path in exclude:
-                continue
+    while directories:
+        # unreadable directories are skipped like os.walk does
+        try:
+            entries = os.scandir(directories.pop())
+        except OSError:
+            continue
 
-            if extension is not None and file_path.suffix != extension:
-                continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                    continue
 
-            file_paths.append(file_path)
+                if not entry.is_file():
+                    continue
 
-    return file_paths
+                if (
+                    extension is not None
+                    and os.path.splitext(entry.name)[1] != extension
+                ):
+                    continue
+
+                file_path = Path(entry.path)
+
+                if file_path in excluded_paths:
+                    continue
+
+                yield file_path
+
+
+def _advise_will_need(file_path: Path) -> None:
+    """Ask the kernel to read the file into the page cache in the background."""
+
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def prefetch_files(file_paths: Iterable[Path], window: int = 128) -> Iterator[Path]:
+    """Yields the files while reading up to window files ahead of the consumer.
+
+    The read ahead is only a hint to the kernel, so this falls back to yielding
+    the files unchanged on platforms without posix_fadvise.
+    """
+
+    if not hasattr(os, "posix_fadvise"):
+        yield from file_paths
+        return
+
+    pending_paths: deque[Path] = deque()
+
+    for file_path in file_paths:
+        _advise_will_need(file_path)
+        pending_paths.append(file_path)
+
+        if len(pending_paths) >= window:
+            yield pending_paths.popleft()
+
+    yield from pending_paths
+
+
+def _read_file(file_path: Path) -> bytes:
+    """Reads the file with a single read call for files of the expected size."""
+
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, max(size, 1))]
+
+        # files may grow between the stat and the read
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+
+    return b"".join(chunks)
+
+
+def bulk_read(file_paths: list[Path], workers: int | None = None) -> list[bytes]:
+    """Returns the contents of the files, reading them concurrently.
+
+    Reading many small files one after another is bound by the latency of the
+    system calls, so the reads are overlapped in a thread pool.
+    """
+
+    if len(file_paths) <= 1:
+        return [_read_file(file_path) for file_path in file_paths]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_read_file, file_paths))
+
+
+def get_files(
+    path: Path, extension: str | None = None, exclude: list[Path] | None = None
+) -> list[Path]:
+    """Returns a list of files in the specified directory and its subdirectories."""
+
+    return list(iter_files(path, extension, exclude))
@@ -21,29 +21,15 @@ class AnimationsMapper:
             dtype=np.float32,
         )
 
-        if baf.path.stem.lower() == "sitzung1_kutte":
-            pass
+        baf_name_parts = set(baf.path.stem.lower().split("_"))
 
         for bgf_path, bgf_vertices_np in bgf_to_vertices.items():
             if bgf_vertices_np.shape[0] != baf_vertices_np.shape[0]:
                 continue
 
-            baf_name = baf.path.stem
-            bgf_name = bgf_path.stem
+            bgf_name_parts = bgf_path.stem.lower().split("_")
 
-            baf_name_parts = [part.lower() for part in baf_name.split("_")]
-            bgf_name_parts = [part.lower() for part in bgf_name.split("_")]
-
-            baf_name_parts = [
-                "".join([char for char in part]) for part in baf_name_parts
-            ]
-            bgf_name_parts = [
-                "".join([char for char in part]) for part in bgf_name_parts
-            ]
-
-            if not any(
-                baf_name_part in bgf_name_parts for baf_name_part in baf_name_parts
-            ):
+            if baf_name_parts.isdisjoint(bgf_name_parts):
                 continue
 
             mapped_bgfs.append(bgf_path)
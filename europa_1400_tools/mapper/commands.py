@@ -63,7 +63,7 @@ def cmd_map_animations(
     )
 
     with open(output_path, "wb") as output_file:
-        pickle.dump(baf_to_bgfs, output_file)
+        pickle.dump(baf_to_bgfs, output_file, protocol=pickle.HIGHEST_PROTOCOL)
 
     # output the missing paths into self.common_options.missing_paths_path text file
 
@@ -133,11 +133,11 @@ def map_animations(
 
             continue
 
-        baf_path_to_bgf_paths[stripped_baf_path] = []
-
-        for bgf_path in mapped_bgf_paths:
-            stripped_bgf_path = bgf_path.relative_to(extracted_objects_path)
-            baf_path_to_bgf_paths[stripped_baf_path].append(stripped_bgf_path)
+        # build the list before storing it, to look up the animation only once
+        baf_path_to_bgf_paths[stripped_baf_path] = [
+            bgf_path.relative_to(extracted_objects_path)
+            for bgf_path in mapped_bgf_paths
+        ]
 
     logging.info(f"Found mapping for {len(bafs) - missing_count} animations.")
 
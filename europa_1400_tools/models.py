@@ -2,12 +2,14 @@
 
 from abc import ABC
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 from europa_1400_tools.const import (
     A_GEB_DAT,
     A_OBJ_DAT,
     ANIMATIONS_BIN,
+    CONVERSION_CACHE_DIR,
     CONVERTED_DIR,
     DATA_DIR,
     DECODED_DIR,
@@ -27,153 +29,169 @@ from europa_1400_tools.const import (
     OUTPUT_TEXTURES_DIR,
     RESOURCES_DIR,
     SCENES_BIN,
+    SERVER_SOCKET,
     SFX_DIR,
     TEXTURES_BIN,
     TargetFormat,
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class CommonOptions:
-    """Common options."""
+    """Common options.
+
+    The options are frozen, so the derived paths are only built once.
+    """
 
     game_path: Path
     output_path: Path
     use_cache: bool
     verbose: bool
     target_format: TargetFormat | None = None
+    jobs: int | None = None
+    use_conversion_cache: bool = True
 
-    @property
+    @cached_property
     def game_resources_path(self) -> Path:
         """Return the path to the resources directory."""
         return self.game_path / RESOURCES_DIR
 
-    @property
+    @cached_property
     def game_data_path(self) -> Path:
         """Return the path to the data directory."""
         return self.game_path / DATA_DIR
 
-    @property
+    @cached_property
     def extracted_path(self) -> Path:
         """Return the path to the extracted directory."""
         return self.output_path / EXTRACTED_DIR
 
-    @property
+    @cached_property
     def decoded_path(self) -> Path:
         """Return the path to the decoded directory."""
         return self.output_path / DECODED_DIR
 
-    @property
+    @cached_property
     def converted_path(self) -> Path:
         """Return the path to the converted directory."""
         return self.output_path / CONVERTED_DIR
 
-    @property
+    @cached_property
+    def conversion_cache_path(self) -> Path:
+        """Return the path to the conversion cache directory."""
+        return self.converted_path / CONVERSION_CACHE_DIR
+
+    @cached_property
+    def server_socket_path(self) -> Path:
+        """Return the path to the socket of the conversion server."""
+        return self.output_path / SERVER_SOCKET
+
+    @cached_property
     def game_textures_path(self) -> Path:
         """Return the path to the textures file."""
         return self.game_resources_path / TEXTURES_BIN
 
-    @property
+    @cached_property
     def extracted_textures_path(self) -> Path:
         """Return the path to the extracted textures directory."""
         return self.output_path / EXTRACTED_DIR / OUTPUT_TEXTURES_DIR
 
-    @property
+    @cached_property
     def game_ageb_path(self) -> Path:
         """Return the path to the A_Geb file."""
         return self.game_data_path / A_GEB_DAT
 
-    @property
+    @cached_property
     def game_aobj_path(self) -> Path:
         """Return the path to the A_Obj file."""
         return self.game_data_path / A_OBJ_DAT
 
-    @property
+    @cached_property
     def game_objects_path(self) -> Path:
         """Return the path to the game objects directory."""
         return self.game_resources_path / OBJECTS_BIN
 
-    @property
+    @cached_property
     def extracted_objects_path(self) -> Path:
         """Return the path to the extracted objects directory."""
         return self.extracted_path / OUTPUT_OBJECTS_DIR
 
-    @property
+    @cached_property
     def decoded_objects_path(self) -> Path:
         """Return the path to the decoded objects directory."""
         return self.decoded_path / OUTPUT_OBJECTS_DIR
 
-    @property
+    @cached_property
     def converted_objects_path(self) -> Path:
         """Return the path to the converted objects directory."""
         return self.converted_path / OUTPUT_OBJECTS_DIR
 
-    @property
+    @cached_property
     def game_animations_path(self) -> Path:
         """Return the path to the game animations directory."""
         return self.game_resources_path / ANIMATIONS_BIN
 
-    @property
+    @cached_property
     def extracted_animations_path(self) -> Path:
         """Return the path to the extracted animations directory."""
         return self.extracted_path / OUTPUT_ANIMATIONS_DIR
 
-    @property
+    @cached_property
     def decoded_animations_path(self) -> Path:
         """Return the path to the decoded animations directory."""
         return self.decoded_path / OUTPUT_ANIMATIONS_DIR
 
-    @property
+    @cached_property
     def converted_animations_path(self) -> Path:
         """Return the path to the converted animations directory."""
         return self.converted_path / OUTPUT_ANIMATIONS_DIR
 
-    @property
+    @cached_property
     def mapped_animations_path(self) -> Path:
         """Return the path to the mapped animations directory."""
         return self.output_path / MAPPED_ANIMATONS_PICKLE
 
-    @property
+    @cached_property
     def missing_paths_path(self) -> Path:
         """Return the path to the missing paths file."""
         return self.output_path / MISSING_PATHS_TXT
 
-    @property
+    @cached_property
     def game_gfx_path(self) -> Path:
         """Return the path to the game gfx directory."""
         return self.game_path / GFX_DIR / GILDE_ADD_ON_GERMAN_GFX
 
-    @property
+    @cached_property
     def converted_gfx_path(self) -> Path:
         """Return the path to the converted gfx directory."""
         return self.converted_path / OUTPUT_GFX_DIR
 
-    @property
+    @cached_property
     def game_sfx_path(self) -> Path:
         """Return the path to the game sfx directory."""
         return self.game_path / SFX_DIR
 
-    @property
+    @cached_property
     def converted_sfx_path(self) -> Path:
         """Return the path to the converted sfx directory."""
         return self.converted_path / OUTPUT_SFX_DIR
 
-    @property
+    @cached_property
     def game_scenes_path(self) -> Path:
         """Return the path to the game scenes directory."""
         return self.game_resources_path / SCENES_BIN
 
-    @property
+    @cached_property
     def converted_scenes_path(self) -> Path:
         """Return the path to the converted scenes directory."""
         return self.converted_path / OUTPUT_SCENES_DIR
 
-    @property
+    @cached_property
     def game_groups_path(self) -> Path:
         """Return the path to the game groups directory."""
         return self.game_resources_path / GROUPS_BIN
 
-    @property
+    @cached_property
     def converted_groups_path(self) -> Path:
         """Return the path to the converted groups directory."""
         return self.converted_path / OUTPUT_GROUPS_DIR
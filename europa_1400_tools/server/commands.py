@@ -0,0 +1,164 @@
+"""Commands for serving conversions from a long running process."""
+
+import json
+import logging
+import socket
+import socketserver
+from pathlib import Path
+from typing import Annotated, Any, List, Optional
+
+import typer
+
+from europa_1400_tools.const import SERVER_HOST, SERVER_PORT, TyperTargetFormat
+from europa_1400_tools.converter._parallel import persistent_executors
+from europa_1400_tools.converter.commands import convert_paths
+from europa_1400_tools.models import CommonOptions
+
+serve_app = typer.Typer()
+client_app = typer.Typer()
+
+# unix domain sockets are not available on every platform
+HAS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+
+class ConversionRequestHandler(socketserver.StreamRequestHandler):
+    """Handle newline delimited json conversion requests."""
+
+    server: "ConversionServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            response: dict[str, Any]
+
+            try:
+                request = json.loads(line)
+
+                output_paths = convert_paths(
+                    self.server.common_options,
+                    [Path(path) for path in request.get("paths", [])],
+                    request.get("target_formats"),
+                    request.get("create_subdirectories", False),
+                )
+
+                response = {"output_paths": [str(path) for path in output_paths]}
+            except Exception as exception:  # pylint: disable=broad-except
+                logging.exception("Conversion request failed")
+                response = {"error": str(exception)}
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class ConversionServer(socketserver.BaseServer):
+    """Server converting files with the converters and workers kept warm."""
+
+    common_options: CommonOptions
+
+
+if HAS_UNIX_SOCKETS:
+
+    class UnixConversionServer(ConversionServer, socketserver.UnixStreamServer):
+        """Conversion server listening on a unix domain socket."""
+
+
+class TcpConversionServer(ConversionServer, socketserver.TCPServer):
+    """Conversion server listening on localhost."""
+
+    allow_reuse_address = True
+
+
+def _connect(common_options: CommonOptions) -> socket.socket:
+    """Connect to the conversion server."""
+
+    if HAS_UNIX_SOCKETS:
+        client_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client_socket.connect(str(common_options.server_socket_path))
+        return client_socket
+
+    return socket.create_connection((SERVER_HOST, SERVER_PORT))
+
+
+@serve_app.callback(invoke_without_command=True)
+def serve(ctx: typer.Context) -> None:
+    """Serve conversions until interrupted."""
+
+    common_options: CommonOptions = ctx.obj
+
+    server: ConversionServer
+
+    # never take over from a server that is still running
+    try:
+        with _connect(common_options):
+            pass
+    except OSError:
+        pass
+    else:
+        logging.error("A conversion server is already running")
+        raise typer.Exit(code=1)
+
+    if HAS_UNIX_SOCKETS:
+        # the socket can only be left behind by a server that is gone
+        socket_path = common_options.server_socket_path
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        socket_path.unlink(missing_ok=True)
+
+        server = UnixConversionServer(str(socket_path), ConversionRequestHandler)
+        logging.info(f"Serving conversions on {socket_path}")
+    else:
+        server = TcpConversionServer(
+            (SERVER_HOST, SERVER_PORT), ConversionRequestHandler
+        )
+        logging.info(f"Serving conversions on {SERVER_HOST}:{SERVER_PORT}")
+
+    server.common_options = common_options
+
+    # requests are handled one after another, sharing the warm worker pools
+    try:
+        with server, persistent_executors():
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if HAS_UNIX_SOCKETS:
+            common_options.server_socket_path.unlink(missing_ok=True)
+
+
+@client_app.callback(invoke_without_command=True)
+def client(
+    ctx: typer.Context,
+    typer_target_formats: Optional[List[TyperTargetFormat]] = typer.Option(
+        None,
+        "--target-format",
+        "-t",
+        help="Target formats, can be given multiple times.",
+    ),
+    create_subdirectories: bool = typer.Option(False, "--create-subdirectories", "-c"),
+    paths: Annotated[
+        Optional[List[Path]], typer.Argument(help="Paths to files or directories.")
+    ] = None,
+) -> None:
+    """Convert files with a running conversion server."""
+
+    common_options: CommonOptions = ctx.obj
+
+    request = {
+        "paths": [str(path.resolve()) for path in paths or []],
+        "target_formats": [
+            typer_target_format.value for typer_target_format in typer_target_formats
+        ]
+        if typer_target_formats
+        else None,
+        "create_subdirectories": create_subdirectories,
+    }
+
+    with _connect(common_options) as client_socket:
+        client_socket.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        with client_socket.makefile("rb") as response_file:
+            response = json.loads(response_file.readline())
+
+    if "error" in response:
+        logging.error(response["error"])
+        raise typer.Exit(code=1)
+
+    for output_path in response["output_paths"]:
+        typer.echo(output_path)